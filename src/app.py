@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from dataclasses import asdict
 from pathlib import Path
 from typing import List, Optional
 from uuid import uuid4
@@ -13,8 +14,10 @@ from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 
 from src.services.document_parser import ParsedDocument, parse_document
+from src.services.fact_index import FACT_KINDS
 from src.services.llm_client import LLMClient
 from src.services.rating_logger import RatingEntry, log_rating
+from src.services.rating_stats import RatingStats
 from src.services.session_store import SessionStore
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -68,6 +71,26 @@ class PromptImproveResponse(BaseModel):
     improved_prompt: str
 
 
+class FactResponse(BaseModel):
+    """Факт из индекса документа."""
+    kind: str
+    value: str
+    raw: str
+    page: int
+
+
+class DocumentFactsResponse(BaseModel):
+    """Факты одного документа."""
+    name: str
+    facts: List[FactResponse]
+
+
+class FactsResponse(BaseModel):
+    """Ответ с индексом фактов по документам сессии."""
+    session_id: str
+    documents: List[DocumentFactsResponse]
+
+
 class RatingRequest(BaseModel):
     """Запрос на логирование рейтинга."""
     session_id: str
@@ -76,6 +99,7 @@ class RatingRequest(BaseModel):
     role: str
     mode: str
     question: str
+    template: str = Field("free_text", max_length=64)
 
 
 def get_session_store() -> SessionStore:
@@ -99,6 +123,17 @@ def get_rating_log_path() -> Path:
     return app.state.rating_log_path
 
 
+def get_rating_stats() -> RatingStats:
+    """Получить агрегаты рейтингов для текущего файла логирования."""
+    log_path = get_rating_log_path()
+    stats = getattr(app.state, "rating_stats", None)
+    if stats is None or stats.log_path != log_path:
+        state_path = log_path.with_name(f"{log_path.stem}_stats.json")
+        stats = RatingStats(log_path=log_path, state_path=state_path)
+        app.state.rating_stats = stats
+    return stats
+
+
 def validate_uploads(files: List[UploadFile]) -> None:
     """Проверить количество загружаемых файлов."""
     if not 1 <= len(files) <= 5:
@@ -190,6 +225,29 @@ async def improve_prompt(request: PromptImproveRequest) -> PromptImproveResponse
     return PromptImproveResponse(improved_prompt=improved)
 
 
+@app.get("/api/facts", response_model=FactsResponse)
+async def get_facts(session_id: str, kind: Optional[str] = None) -> FactsResponse:
+    """Вернуть структурированные факты документов сессии."""
+    if kind is not None and kind not in FACT_KINDS:
+        raise HTTPException(status_code=400, detail=f"Неизвестный тип факта: {kind}.")
+
+    session_store = get_session_store()
+    session = session_store.get_session(session_id)
+    if session is None or not session.documents:
+        raise HTTPException(status_code=400, detail="Сначала загрузите документы.")
+
+    documents = []
+    for doc in session.documents:
+        facts = doc.facts.facts if kind is None else doc.facts.find(kind)
+        documents.append(
+            DocumentFactsResponse(
+                name=doc.name,
+                facts=[FactResponse(**asdict(fact)) for fact in facts],
+            )
+        )
+    return FactsResponse(session_id=session_id, documents=documents)
+
+
 @app.post("/api/rating")
 async def rate_answer(request: RatingRequest, raw_request: Request) -> dict:
     """Логировать оценку ответа."""
@@ -200,12 +258,21 @@ async def rate_answer(request: RatingRequest, raw_request: Request) -> dict:
         role=request.role,
         mode=request.mode,
         question=request.question,
+        template=request.template,
         ip=raw_request.client.host if raw_request.client else "unknown",
     )
     log_rating(entry, get_rating_log_path())
     return {"status": "ok"}
 
 
+@app.get("/api/ratings/stats")
+async def rating_stats() -> dict:
+    """Вернуть агрегаты оценок по ролям, режимам, шаблонам вопросов и дням."""
+    stats = get_rating_stats()
+    stats.refresh()
+    return stats.to_dict()
+
+
 @app.get("/api/health")
 async def health() -> dict:
     """Проверка доступности сервиса."""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List
 
@@ -8,12 +8,15 @@ import mammoth
 from openpyxl import load_workbook
 from pypdf import PdfReader
 
+from src.services.fact_index import FactIndex, build_fact_index
+
 
 @dataclass
 class ParsedDocument:
     name: str
     text: str
     pages: List[str]
+    facts: FactIndex = field(default_factory=FactIndex)
 
 
 def parse_document(file_path: Path, display_name: str) -> ParsedDocument:
@@ -31,7 +34,8 @@ def parse_document(file_path: Path, display_name: str) -> ParsedDocument:
         pages = [extract_md_text(file_path)]
 
     combined = normalize_text(pages)
-    return ParsedDocument(name=display_name, text=combined, pages=pages)
+    facts = build_fact_index(pages)
+    return ParsedDocument(name=display_name, text=combined, pages=pages, facts=facts)
 
 
 def extract_docx_text(file_path: Path) -> str:
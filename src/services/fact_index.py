@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional, Tuple
+
+FACT_KINDS = ("amount", "vat_rate", "date", "inn", "invalid_inn", "kpp", "counterparty")
+
+MONTHS = {
+    "января": 1,
+    "февраля": 2,
+    "марта": 3,
+    "апреля": 4,
+    "мая": 5,
+    "июня": 6,
+    "июля": 7,
+    "августа": 8,
+    "сентября": 9,
+    "октября": 10,
+    "ноября": 11,
+    "декабря": 12,
+}
+
+NUMBER_PATTERN = r"(\d{1,3}(?:[ \u00a0\u2009\u202f]\d{3})+|\d+)(?:[.,](\d{1,2}))?"
+AMOUNT_RE = re.compile(
+    r"(?<![\d.,])" + NUMBER_PATTERN + r"\s*(руб(?:лей|ля|ль|\.)?|₽|RUB|USD|EUR|\$|€)",
+    re.IGNORECASE,
+)
+AMOUNT_PREFIX_RE = re.compile(r"([$€₽])\s*" + NUMBER_PATTERN + r"(?![\d.,]\d)")
+CLAUSE_MARKER_RE = re.compile(
+    r"(?:(?<![а-яё])(?:пп?|ст|гл|разд)\.|(?<![а-яё.])(?<!т\.\s)ч\.|№"
+    r"|(?<![а-яё])(?:пункт|стать|част)[а-яё]*)\s*$",
+    re.IGNORECASE,
+)
+GROUP_SEPARATOR_RE = re.compile(r"[ \u00a0\u2009\u202f]")
+VAT_RE = re.compile(
+    r"НДС\s*\(?\s*(?:по\s+ставке\s+)?(\d{1,2}(?:[.,]\d+)?)\s*%"
+    r"|(\d{1,2}(?:[.,]\d+)?)\s*%\s*\)?\s*НДС",
+    re.IGNORECASE,
+)
+VAT_EXEMPT_RE = re.compile(
+    r"без\s+НДС|НДС\s+не\s+облагается|не\s+облагается\s+НДС",
+    re.IGNORECASE,
+)
+NUMERIC_DATE_RE = re.compile(r"(?<!\d)(\d{1,2})\.(\d{1,2})\.(\d{4})(?!\d)")
+TEXT_DATE_RE = re.compile(
+    r"«?(\d{1,2})»?\s+(" + "|".join(MONTHS) + r")\s+(\d{4})",
+    re.IGNORECASE,
+)
+INN_KPP_RE = re.compile(r"ИНН\s*/\s*КПП\s*[:№]?\s*(\d{10}|\d{12})\s*/\s*(\d{9})(?!\d)")
+INN_RE = re.compile(r"ИНН\s*[:№]?\s*(\d{10}|\d{12})(?!\d)")
+KPP_RE = re.compile(r"КПП\s*[:№]?\s*(\d{9})(?!\d)")
+COUNTERPARTY_RE = re.compile(r"\b(ООО|АО|ПАО|ЗАО|ОАО|НАО|ИП)\s*[«\"“]([^»\"”\n]{1,120})[»\"”]")
+
+CURRENCIES = {"₽": "RUB", "$": "USD", "€": "EUR"}
+
+
+@dataclass
+class Fact:
+    """Структурированный факт, найденный в тексте документа."""
+    kind: str
+    value: str
+    raw: str
+    page: int
+
+
+@dataclass
+class FactIndex:
+    """Индекс фактов документа для быстрых детерминированных проверок."""
+    facts: List[Fact] = field(default_factory=list)
+
+    def find(self, kind: str, page: Optional[int] = None) -> List[Fact]:
+        """Найти факты заданного типа, опционально на конкретной странице."""
+        return [
+            fact
+            for fact in self.facts
+            if fact.kind == kind and (page is None or fact.page == page)
+        ]
+
+    def values(self, kind: str) -> List[str]:
+        """Вернуть уникальные значения фактов в порядке появления."""
+        return list(dict.fromkeys(fact.value for fact in self.find(kind)))
+
+    def pages_for(self, kind: str, value: str) -> List[int]:
+        """Вернуть страницы, на которых встречается значение."""
+        return sorted({fact.page for fact in self.find(kind) if fact.value == value})
+
+
+def build_fact_index(pages: List[str]) -> FactIndex:
+    """Извлечь суммы, ставки НДС, даты, ИНН/КПП и контрагентов по страницам."""
+    facts: List[Fact] = []
+    for page_number, page_text in enumerate(pages, start=1):
+        facts.extend(extract_amounts(page_text, page_number))
+        facts.extend(extract_vat_rates(page_text, page_number))
+        facts.extend(extract_dates(page_text, page_number))
+        facts.extend(extract_requisites(page_text, page_number))
+        facts.extend(extract_counterparties(page_text, page_number))
+    return FactIndex(facts=facts)
+
+
+def extract_amounts(text: str, page: int) -> List[Fact]:
+    """Найти денежные суммы с валютой до или после числа."""
+    found: List[Tuple[int, Fact]] = []
+    for match in AMOUNT_RE.finditer(text):
+        integer = match.group(1)
+        start = match.start()
+        groups = GROUP_SEPARATOR_RE.split(integer)
+        if len(groups) > 1 and CLAUSE_MARKER_RE.search(text[:start]):
+            # «п. 3 100 рублей»: первая группа — номер пункта, а не разряд суммы.
+            start = match.start(1) + len(groups[0]) + 1
+            integer = "".join(groups[1:])
+        value = format_amount(integer, match.group(2), match.group(3))
+        raw = text[start:match.end()].strip()
+        found.append((start, Fact(kind="amount", value=value, raw=raw, page=page)))
+    for match in AMOUNT_PREFIX_RE.finditer(text):
+        value = format_amount(match.group(2), match.group(3), match.group(1))
+        found.append((match.start(), Fact(kind="amount", value=value, raw=match.group(0), page=page)))
+    return [fact for _, fact in sorted(found, key=lambda item: item[0])]
+
+
+def format_amount(integer: str, fraction: Optional[str], token: str) -> str:
+    """Привести сумму к виду «1234.50 RUB»."""
+    digits = GROUP_SEPARATOR_RE.sub("", integer)
+    cents = (fraction or "00").ljust(2, "0")
+    currency = CURRENCIES.get(token, token.upper())
+    if currency.startswith("РУБ"):
+        currency = "RUB"
+    return f"{int(digits)}.{cents} {currency}"
+
+
+def extract_vat_rates(text: str, page: int) -> List[Fact]:
+    """Найти ставки НДС и упоминания об освобождении от НДС."""
+    facts: List[Fact] = []
+    for match in VAT_RE.finditer(text):
+        rate = (match.group(1) or match.group(2)).replace(",", ".")
+        facts.append(Fact(kind="vat_rate", value=rate, raw=match.group(0).strip(), page=page))
+    for match in VAT_EXEMPT_RE.finditer(text):
+        facts.append(Fact(kind="vat_rate", value="exempt", raw=match.group(0).strip(), page=page))
+    return facts
+
+
+def extract_dates(text: str, page: int) -> List[Fact]:
+    """Найти даты в формате ДД.ММ.ГГГГ и «ДД» месяца ГГГГ."""
+    facts: List[Fact] = []
+    for match in NUMERIC_DATE_RE.finditer(text):
+        parsed = to_iso_date(int(match.group(3)), int(match.group(2)), int(match.group(1)))
+        if parsed:
+            facts.append(Fact(kind="date", value=parsed, raw=match.group(0), page=page))
+    for match in TEXT_DATE_RE.finditer(text):
+        month = MONTHS[match.group(2).lower()]
+        parsed = to_iso_date(int(match.group(3)), month, int(match.group(1)))
+        if parsed:
+            facts.append(Fact(kind="date", value=parsed, raw=match.group(0), page=page))
+    return facts
+
+
+def extract_requisites(text: str, page: int) -> List[Fact]:
+    """Найти ИНН и КПП; ИНН с неверными контрольными разрядами помечаются отдельно."""
+    facts: List[Fact] = []
+    for match in INN_KPP_RE.finditer(text):
+        facts.append(inn_fact(match.group(1), match.group(0), page))
+        facts.append(Fact(kind="kpp", value=match.group(2), raw=match.group(0), page=page))
+    for match in INN_RE.finditer(text):
+        facts.append(inn_fact(match.group(1), match.group(0), page))
+    for match in KPP_RE.finditer(text):
+        facts.append(Fact(kind="kpp", value=match.group(1), raw=match.group(0), page=page))
+    return facts
+
+
+def inn_fact(inn: str, raw: str, page: int) -> Fact:
+    """Создать факт ИНН с учетом проверки контрольных разрядов."""
+    kind = "inn" if is_valid_inn(inn) else "invalid_inn"
+    return Fact(kind=kind, value=inn, raw=raw, page=page)
+
+
+def extract_counterparties(text: str, page: int) -> List[Fact]:
+    """Найти наименования контрагентов с организационно-правовой формой."""
+    facts: List[Fact] = []
+    for match in COUNTERPARTY_RE.finditer(text):
+        name = " ".join(match.group(2).split())
+        facts.append(
+            Fact(
+                kind="counterparty",
+                value=f"{match.group(1)} «{name}»",
+                raw=match.group(0),
+                page=page,
+            )
+        )
+    return facts
+
+
+def to_iso_date(year: int, month: int, day: int) -> Optional[str]:
+    """Преобразовать дату в ISO-формат, отбросив некорректные значения."""
+    try:
+        return date(year, month, day).isoformat()
+    except ValueError:
+        return None
+
+
+def is_valid_inn(inn: str) -> bool:
+    """Проверить контрольные разряды ИНН (10 или 12 цифр)."""
+    if not inn.isdigit():
+        return False
+    digits = [int(char) for char in inn]
+
+    def checksum(weights: List[int]) -> int:
+        return sum(w * d for w, d in zip(weights, digits)) % 11 % 10
+
+    if len(digits) == 10:
+        return checksum([2, 4, 10, 3, 5, 9, 4, 6, 8]) == digits[9]
+    if len(digits) == 12:
+        first = checksum([7, 2, 4, 10, 3, 5, 9, 4, 6, 8])
+        second = checksum([3, 7, 2, 4, 10, 3, 5, 9, 4, 6, 8])
+        return first == digits[10] and second == digits[11]
+    return False
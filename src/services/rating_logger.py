@@ -16,6 +16,7 @@ class RatingEntry:
     mode: str
     question: str
     ip: str
+    template: str = "free_text"
     timestamp: str = ""
 
 
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple
+
+GroupKey = Tuple[str, str, str, str]
+
+BLOCK_SIZE = 64 * 1024
+OTHER = "other"
+ROLES = {"sales", "bu", "legal"}
+MODES = {"short", "extended", "full"}
+FREE_TEXT_TEMPLATES = {"free_text", "custom_check"}
+# Идентификаторы ROLE_DEFAULTS из src/ui/static/app.js.
+DEFAULT_TEMPLATES = {
+    "sales-1", "sales-2", "sales-3", "sales-4", "sales-5",
+    "bu-1", "bu-2", "bu-3", "bu-4", "bu-5",
+    "legal-1", "legal-2", "legal-3", "legal-4", "legal-5",
+}
+
+
+@dataclass
+class RatingCounts:
+    """Счетчики положительных и отрицательных оценок."""
+    up: int = 0
+    down: int = 0
+
+    def add(self, rating: str) -> None:
+        """Учесть одну оценку."""
+        if rating == "up":
+            self.up += 1
+        elif rating == "down":
+            self.down += 1
+
+
+class RatingStats:
+    """Инкрементальные агрегаты рейтингов с чекпоинтом на диске."""
+
+    def __init__(self, log_path: Path, state_path: Path) -> None:
+        """Загрузить чекпоинт и дочитать новые записи журнала."""
+        self.log_path = log_path
+        self.state_path = state_path
+        self._offset = 0
+        self._fingerprint = ""
+        self._groups: Dict[GroupKey, RatingCounts] = {}
+        self._load_checkpoint()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Дочитать журнал с последнего смещения и обновить агрегаты."""
+        if not self.log_path.exists():
+            return
+        with self.log_path.open("rb") as handle:
+            fingerprint = log_fingerprint(handle)
+            size = handle.seek(0, 2)
+            if size < self._offset or (self._offset and fingerprint != self._fingerprint):
+                # Журнал усечен или заменен: чекпоинт к нему не относится.
+                self._offset = 0
+                self._groups = {}
+            self._fingerprint = fingerprint
+            start = self._offset
+            handle.seek(start)
+            pending = b""
+            while True:
+                block = handle.read(BLOCK_SIZE)
+                if not block:
+                    break
+                lines = (pending + block).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    self._apply(line)
+                    self._offset += len(line) + 1
+        if self._offset != start:
+            self._save_checkpoint()
+
+    def to_dict(self) -> Dict[str, object]:
+        """Вернуть агрегаты по группам и итоги по каждому измерению."""
+        groups = [
+            {
+                "role": role,
+                "mode": mode,
+                "template": template,
+                "day": day,
+                "up": counts.up,
+                "down": counts.down,
+            }
+            for (role, mode, template, day), counts in sorted(self._groups.items())
+        ]
+        return {
+            "total": self._totals_by(None),
+            "by_role": self._totals_by(0),
+            "by_mode": self._totals_by(1),
+            "by_template": self._totals_by(2),
+            "by_day": self._totals_by(3),
+            "groups": groups,
+        }
+
+    def _apply(self, line: bytes) -> None:
+        """Учесть одну строку журнала, пропуская поврежденные записи."""
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return
+        if not isinstance(record, dict):
+            return
+        key = (
+            bounded_key(record.get("role"), ROLES),
+            bounded_key(record.get("mode"), MODES),
+            bounded_key(record.get("template"), FREE_TEXT_TEMPLATES | DEFAULT_TEMPLATES),
+            str(record.get("timestamp", ""))[:10],
+        )
+        self._groups.setdefault(key, RatingCounts()).add(str(record.get("rating", "")))
+
+    def _totals_by(self, position: Optional[int]) -> Dict[str, object]:
+        """Свернуть группы по одному измерению ключа."""
+        if position is None:
+            total = RatingCounts()
+            for counts in self._groups.values():
+                total.up += counts.up
+                total.down += counts.down
+            return {"up": total.up, "down": total.down}
+        totals: Dict[str, RatingCounts] = {}
+        for key, counts in self._groups.items():
+            bucket = totals.setdefault(key[position], RatingCounts())
+            bucket.up += counts.up
+            bucket.down += counts.down
+        return {
+            name: {"up": counts.up, "down": counts.down}
+            for name, counts in sorted(totals.items())
+        }
+
+    def _load_checkpoint(self) -> None:
+        """Прочитать сохраненные агрегаты и смещение в журнале."""
+        if not self.state_path.exists():
+            return
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            offset = int(state["offset"])
+            fingerprint = str(state["fingerprint"])
+            rows: List[list] = state["groups"]
+            groups = {
+                (str(row[0]), str(row[1]), str(row[2]), str(row[3])): RatingCounts(
+                    up=int(row[4]),
+                    down=int(row[5]),
+                )
+                for row in rows
+            }
+        except (ValueError, KeyError, IndexError, TypeError):
+            return
+        self._offset = offset
+        self._fingerprint = fingerprint
+        self._groups = groups
+
+    def _save_checkpoint(self) -> None:
+        """Атомарно сохранить агрегаты и смещение."""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        rows = [
+            [role, mode, template, day, counts.up, counts.down]
+            for (role, mode, template, day), counts in self._groups.items()
+        ]
+        payload = json.dumps(
+            {"offset": self._offset, "fingerprint": self._fingerprint, "groups": rows},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        tmp_path.replace(self.state_path)
+
+
+def bounded_key(value: object, allowed: Set[str]) -> str:
+    """Свести значение к допустимому ключу группировки или к «other»."""
+    if isinstance(value, str) and value in allowed:
+        return value
+    return OTHER
+
+
+def log_fingerprint(handle: BinaryIO) -> str:
+    """Посчитать отпечаток журнала по его первой строке."""
+    handle.seek(0)
+    first_line = handle.readline(4096)
+    return hashlib.sha256(first_line).hexdigest()[:16]
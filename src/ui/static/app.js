@@ -233,7 +233,8 @@ function buildCheckCard(check, isDefault) {
 
   const runBtn = document.createElement("button");
   runBtn.textContent = "Запустить";
-  runBtn.onclick = () => sendMessage(check.prompt);
+  runBtn.onclick = () =>
+    sendMessage(check.prompt, isDefault ? check.id : "custom_check");
   actions.appendChild(runBtn);
 
   const editBtn = document.createElement("button");
@@ -378,7 +379,7 @@ function renderDocuments() {
   });
 }
 
-function appendMessage(role, text, messageId = null, question = "") {
+function appendMessage(role, text, messageId = null, question = "", template = "free_text") {
   const wrapper = document.createElement("div");
   wrapper.className = `message ${role}`;
   wrapper.textContent = text;
@@ -387,10 +388,10 @@ function appendMessage(role, text, messageId = null, question = "") {
     rating.className = "rating";
     const up = document.createElement("button");
     up.textContent = "👍";
-    up.onclick = () => submitRating(messageId, "up", question);
+    up.onclick = () => submitRating(messageId, "up", question, template);
     const down = document.createElement("button");
     down.textContent = "👎";
-    down.onclick = () => submitRating(messageId, "down", question);
+    down.onclick = () => submitRating(messageId, "down", question, template);
     rating.appendChild(up);
     rating.appendChild(down);
     wrapper.appendChild(rating);
@@ -399,7 +400,7 @@ function appendMessage(role, text, messageId = null, question = "") {
   elements.chatWindow.scrollTop = elements.chatWindow.scrollHeight;
 }
 
-async function sendMessage(textOverride = null) {
+async function sendMessage(textOverride = null, template = "free_text") {
   const message = textOverride || elements.chatInput.value.trim();
   if (!message) return;
   if (!state.role) {
@@ -428,13 +429,13 @@ async function sendMessage(textOverride = null) {
       throw new Error(error);
     }
     const data = await response.json();
-    appendMessage("assistant", data.answer, data.message_id, message);
+    appendMessage("assistant", data.answer, data.message_id, message, template);
   } catch (error) {
     appendMessage("assistant", `Ошибка: ${error.message}`);
   }
 }
 
-async function submitRating(messageId, rating, question) {
+async function submitRating(messageId, rating, question, template) {
   try {
     await fetch("/api/rating", {
       method: "POST",
@@ -446,6 +447,7 @@ async function submitRating(messageId, rating, question) {
         role: state.role,
         mode: state.mode,
         question: question || "",
+        template: template || "free_text",
       }),
     });
   } catch (error) {
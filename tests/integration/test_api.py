@@ -45,6 +45,34 @@ def test_upload_and_chat(tmp_path: Path) -> None:
             "role": "legal",
             "mode": "short",
             "question": "Вопрос",
+            "template": "legal-1",
         },
     )
     assert rating_response.status_code == 200
+
+    stats_response = client.get("/api/ratings/stats")
+    assert stats_response.status_code == 200
+    assert stats_response.json()["by_role"] == {"legal": {"up": 1, "down": 0}}
+    assert stats_response.json()["by_template"] == {"legal-1": {"up": 1, "down": 0}}
+
+
+def test_facts_endpoint(tmp_path: Path) -> None:
+    client = TestClient(app)
+
+    sample = tmp_path / "offer.md"
+    sample.write_text("Сумма 10 000 руб., НДС 20%. ИНН 7707083893.", encoding="utf-8")
+
+    with sample.open("rb") as handle:
+        client.post(
+            "/api/upload",
+            params={"session_id": "session-facts"},
+            files={"files": ("offer.md", handle, "text/markdown")},
+        )
+
+    response = client.get("/api/facts", params={"session_id": "session-facts", "kind": "amount"})
+    assert response.status_code == 200
+    facts = response.json()["documents"][0]["facts"]
+    assert facts == [{"kind": "amount", "value": "10000.00 RUB", "raw": "10 000 руб.", "page": 1}]
+
+    bad_kind = client.get("/api/facts", params={"session_id": "session-facts", "kind": "unknown"})
+    assert bad_kind.status_code == 400
@@ -0,0 +1,73 @@
+from src.services.fact_index import build_fact_index, is_valid_inn
+
+
+def test_build_fact_index_extracts_facts_with_pages() -> None:
+    pages = [
+        "Поставщик: ООО «Ромашка», ИНН/КПП 7707083893/773601001.\n"
+        "Договор от «12» марта 2024 г.",
+        "Итого: 1 200 000,50 руб., в том числе НДС 20% — 200 000,08 руб.\n"
+        "КП действительно до 31.12.2024.",
+    ]
+    index = build_fact_index(pages)
+
+    assert index.values("counterparty") == ["ООО «Ромашка»"]
+    assert index.values("inn") == ["7707083893"]
+    assert index.values("kpp") == ["773601001"]
+    assert index.values("date") == ["2024-03-12", "2024-12-31"]
+    assert index.values("vat_rate") == ["20"]
+    assert index.values("amount") == ["1200000.50 RUB", "200000.08 RUB"]
+    assert index.pages_for("date", "2024-12-31") == [2]
+    assert [fact.page for fact in index.find("amount")] == [2, 2]
+
+
+def test_build_fact_index_handles_no_vat_and_invalid_dates() -> None:
+    index = build_fact_index(["Цена 500 USD без НДС. Дата 31.02.2024."])
+
+    assert index.values("vat_rate") == ["exempt"]
+    assert index.values("amount") == ["500.00 USD"]
+    assert index.find("date") == []
+
+
+def test_is_valid_inn() -> None:
+    assert is_valid_inn("7707083893")
+    assert is_valid_inn("500100732259")
+    assert not is_valid_inn("7707083894")
+    assert not is_valid_inn("12345")
+
+
+def test_vat_exclusion_does_not_conflict_with_explicit_rate() -> None:
+    index = build_fact_index(["Цена 100 000 руб. без учета НДС. НДС 20% — 20 000 руб."])
+
+    assert index.values("vat_rate") == ["20"]
+
+
+def test_vat_exemption_is_not_zero_rate() -> None:
+    index = build_fact_index(["Услуги НДС не облагаются. Цена 500 руб. без НДС."])
+
+    assert index.values("vat_rate") == ["exempt"]
+
+
+def test_amounts_skip_clause_numbers_and_accept_prefix_currency() -> None:
+    index = build_fact_index(["Согласно п. 3 100 рублей штраф. Лицензия $500, поддержка € 1 200,5."])
+
+    assert index.values("amount") == ["100.00 RUB", "500.00 USD", "1200.50 EUR"]
+    assert index.find("amount")[0].raw == "100 рублей"
+
+
+def test_amounts_keep_thousands_after_abbreviation_tch() -> None:
+    index = build_fact_index(["Итого 6 000 руб., в т.ч. 1 200 руб. НДС; в т. ч. 2 400 руб. аванс."])
+
+    assert index.values("amount") == ["6000.00 RUB", "1200.00 RUB", "2400.00 RUB"]
+
+
+def test_amounts_are_returned_in_document_order() -> None:
+    index = build_fact_index(["Лицензия $500, внедрение 300 USD, поддержка € 100."])
+
+    assert index.values("amount") == ["500.00 USD", "300.00 USD", "100.00 EUR"]
+
+
+def test_invalid_inn_is_flagged() -> None:
+    index = build_fact_index(["ИНН 7707083894, ИНН 7707083893"])
+
+    assert index.values("invalid_inn") == ["7707083894"]
+    assert index.values("inn") == ["7707083893"]
@@ -0,0 +1,111 @@
+from pathlib import Path
+
+import pytest
+
+from src.services import rating_stats
+from src.services.rating_logger import RatingEntry, log_rating
+from src.services.rating_stats import RatingStats
+
+
+def make_entry(rating: str, role: str = "legal", template: str = "legal-1") -> RatingEntry:
+    return RatingEntry(
+        session_id="session",
+        message_id="msg",
+        rating=rating,
+        role=role,
+        mode="short",
+        question="Проверь НДС",
+        ip="127.0.0.1",
+        template=template,
+    )
+
+
+def test_rating_stats_incremental_refresh(tmp_path: Path) -> None:
+    log_path = tmp_path / "ratings.jsonl"
+    stats = RatingStats(log_path=log_path, state_path=tmp_path / "stats.json")
+
+    log_rating(make_entry("up"), log_path)
+    log_rating(make_entry("down", template="free_text"), log_path)
+    stats.refresh()
+    log_rating(make_entry("down", role="sales", template="not-a-template"), log_path)
+    stats.refresh()
+
+    data = stats.to_dict()
+    assert data["total"] == {"up": 1, "down": 2}
+    assert data["by_role"] == {"legal": {"up": 1, "down": 1}, "sales": {"up": 0, "down": 1}}
+    assert data["by_template"] == {
+        "free_text": {"up": 0, "down": 1},
+        "legal-1": {"up": 1, "down": 0},
+        "other": {"up": 0, "down": 1},
+    }
+    assert len(data["groups"]) == 3
+
+
+def test_rating_stats_fold_unknown_keys_into_other(tmp_path: Path) -> None:
+    log_path = tmp_path / "ratings.jsonl"
+    log_rating(make_entry("down", role="random-role", template="legal-99"), log_path)
+    entry = make_entry("up", template="legal-1\n")
+    entry.mode = "verbose"
+    log_rating(entry, log_path)
+
+    data = RatingStats(log_path=log_path, state_path=tmp_path / "stats.json").to_dict()
+    assert data["by_role"] == {"legal": {"up": 1, "down": 0}, "other": {"up": 0, "down": 1}}
+    assert data["by_mode"] == {"other": {"up": 1, "down": 0}, "short": {"up": 0, "down": 1}}
+    assert data["by_template"] == {"other": {"up": 1, "down": 1}}
+
+
+def test_rating_stats_rebuild_from_corrupted_checkpoint(tmp_path: Path) -> None:
+    log_path = tmp_path / "ratings.jsonl"
+    state_path = tmp_path / "stats.json"
+    log_rating(make_entry("up"), log_path)
+    RatingStats(log_path=log_path, state_path=state_path)
+    state_path.write_text(
+        '{"offset":0,"fingerprint":"","groups":[["legal","short","legal-1","2024-01-01","x",0]]}',
+        encoding="utf-8",
+    )
+
+    data = RatingStats(log_path=log_path, state_path=state_path).to_dict()
+    assert data["total"] == {"up": 1, "down": 0}
+
+
+def test_rating_stats_reads_log_in_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(rating_stats, "BLOCK_SIZE", 16)
+    log_path = tmp_path / "ratings.jsonl"
+    for rating in ("up", "down", "up"):
+        log_rating(make_entry(rating), log_path)
+
+    stats = RatingStats(log_path=log_path, state_path=tmp_path / "stats.json")
+    assert stats.to_dict()["total"] == {"up": 2, "down": 1}
+
+
+def test_rating_stats_resume_from_checkpoint(tmp_path: Path) -> None:
+    log_path = tmp_path / "ratings.jsonl"
+    state_path = tmp_path / "stats.json"
+    log_rating(make_entry("up"), log_path)
+    RatingStats(log_path=log_path, state_path=state_path)
+
+    log_rating(make_entry("down"), log_path)
+    with log_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"rating": "down"')
+
+    restored = RatingStats(log_path=log_path, state_path=state_path)
+    assert restored.to_dict()["total"] == {"up": 1, "down": 1}
+
+    log_path.write_text("", encoding="utf-8")
+    log_rating(make_entry("up"), log_path)
+    restored.refresh()
+    assert restored.to_dict()["total"] == {"up": 1, "down": 0}
+
+
+def test_rating_stats_rebuilds_after_log_replacement(tmp_path: Path) -> None:
+    log_path = tmp_path / "ratings.jsonl"
+    state_path = tmp_path / "stats.json"
+    log_rating(make_entry("up"), log_path)
+    RatingStats(log_path=log_path, state_path=state_path)
+
+    log_path.unlink()
+    for _ in range(3):
+        log_rating(make_entry("down", role="sales"), log_path)
+
+    restored = RatingStats(log_path=log_path, state_path=state_path)
+    assert restored.to_dict()["total"] == {"up": 0, "down": 3}